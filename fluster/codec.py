@@ -34,9 +34,10 @@ class PixelFormat(Enum):
 
     def to_gst(self):
         '''Return GStreamer pixel format'''
-        mapping = {
-            self.yuv420p: 'I420',
-            self.yuv420p10le: 'I420_10LE'
-        }
+        return GST_PIXEL_FORMATS[self]
 
-        return mapping[self]
+
+GST_PIXEL_FORMATS = {
+    PixelFormat.yuv420p: 'I420',
+    PixelFormat.yuv420p10le: 'I420_10LE'
+}
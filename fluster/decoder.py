@@ -19,10 +19,9 @@
 
 from abc import ABC, abstractmethod
 from functools import lru_cache
-from shutil import which
 
 from fluster.codec import PixelFormat
-from fluster.utils import normalize_binary_cmd
+from fluster.utils import find_binary, normalize_binary_cmd
 
 # pylint: disable=broad-except
 
@@ -50,16 +49,16 @@ class Decoder(ABC):
         '''Checks whether the decoder can be run'''
         if hasattr(self, 'binary') and self.binary:
             try:
-                path = which(self.binary)
-                if verbose and not path:
-                    print(
-                        f"Binary {self.binary} can't be found to be executed")
-
-                return path is not None
+                return find_binary(self.binary, verbose) is not None
             except Exception:
                 return False
         return True
 
+    @property
+    def name_lower(self):
+        '''Return the name of the decoder in lowercase'''
+        return self.name.lower()
+
     def __str__(self):
         return f'    {self.name}: {self.description}'
 
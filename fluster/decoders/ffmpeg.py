@@ -25,7 +25,7 @@ import subprocess
 
 from fluster.codec import Codec, PixelFormat
 from fluster.decoder import Decoder, register_decoder
-from fluster.utils import file_checksum, run_command
+from fluster.utils import file_checksum, find_binary, run_command
 
 FFMPEG_TPL = '{} -i {} -vf format=pix_fmts={} {}'
 
@@ -58,6 +58,8 @@ class FFmpegDecoder(Decoder):
         '''Checks whether the decoder can be run'''
         # pylint: disable=broad-except
         if self.hw_acceleration:
+            if not find_binary(self.binary, verbose):
+                return False
             try:
                 command = [self.binary, '-hwaccels']
                 output = subprocess.check_output(
@@ -23,7 +23,7 @@ from functools import lru_cache
 
 from fluster.codec import Codec, PixelFormat
 from fluster.decoder import Decoder, register_decoder
-from fluster.utils import file_checksum, run_command, normalize_binary_cmd
+from fluster.utils import file_checksum, find_binary, run_command, normalize_binary_cmd
 
 PIPELINE_TPL = '{} filesrc location={} ! {} ! {} ! filesink location={}'
 
@@ -64,6 +64,9 @@ class GStreamer(Decoder):
         # pylint: disable=broad-except
         try:
             binary = normalize_binary_cmd(f'gst-launch-{self.gst_api}')
+            # Don't spawn a process for every decoder if GStreamer isn't there
+            if not find_binary(binary, verbose):
+                return False
             pipeline = f'{binary} appsrc num-buffers=0 ! {self.decoder_bin} ! fakesink'
             run_command(shlex.split(pipeline), verbose=verbose)
         except Exception:
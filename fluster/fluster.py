@@ -19,8 +19,12 @@
 
 import os
 import os.path
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+import multiprocessing.pool
+import pickle
 import sys
+from typing import Dict, List, Optional
 
 # Import decoders that will auto-register
 # pylint: disable=wildcard-import, unused-wildcard-import
@@ -29,8 +33,9 @@ from fluster.decoders import *
 
 from fluster.test_suite import TestSuite
 from fluster.test_suite import Context as TestSuiteContext
-from fluster.decoder import DECODERS
-from fluster.test_vector import TestVectorResult
+from fluster.decoder import DECODERS, Decoder
+from fluster.test_vector import TestVector, TestVectorResult
+from fluster.codec import Codec
 
 # pylint: disable=broad-except
 
@@ -59,11 +64,13 @@ class Context:
         self.verbose = verbose
         self.summary_output = summary_output
 
-    def to_test_suite_context(self, decoder, results_dir, test_vectors):
+    def to_test_suite_context(self, decoder: Decoder, results_dir: str, test_vectors: list,
+                              pool: Optional[multiprocessing.pool.Pool] = None):
         '''Create a TestSuite's Context from this'''
         ts_context = TestSuiteContext(jobs=self.jobs, decoder=decoder, timeout=self.timeout, failfast=self.failfast,
                                       quiet=self.quiet, results_dir=results_dir, reference=self.reference,
-                                      test_vectors=test_vectors, keep_files=self.keep_files, verbose=self.verbose)
+                                      test_vectors=test_vectors, keep_files=self.keep_files, verbose=self.verbose,
+                                      pool=pool)
         return ts_context
 
 
@@ -82,6 +89,88 @@ TEXT_RESULT = {
 }
 
 
+# Bump it whenever the layout of the cache file itself changes
+TEST_SUITES_CACHE_VERSION = 1
+# The cache pickles instances of these classes, so any change in the modules
+# defining them invalidates it
+TEST_SUITES_CACHED_CLASSES = (TestSuite, TestVector, Codec)
+
+
+def _find_json_files(directory: str):
+    json_files = []
+    # Walk the tree with scandir to get the file types without extra stats
+    pending_dirs = [directory]
+    while pending_dirs:
+        subdirs = []
+        try:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.is_file():
+                        json_files.append(entry.path)
+        except OSError:
+            continue
+        # Visit the subdirectories in the same order as os.walk would
+        pending_dirs.extend(reversed(subdirs))
+    return json_files
+
+
+def _test_suites_cache_path():
+    # As per the XDG spec, an empty or relative XDG_CACHE_HOME is ignored
+    cache_dir = os.environ.get('XDG_CACHE_HOME')
+    if not cache_dir or not os.path.isabs(cache_dir):
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'fluster', 'test_suites.pkl')
+
+
+def _file_stamp(path: str):
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _test_suites_cache_version():
+    stamps = tuple(_file_stamp(getattr(sys.modules.get(cls.__module__), '__file__', None))
+                   for cls in TEST_SUITES_CACHED_CLASSES)
+    if None in stamps:
+        raise Exception('Modules of the cached classes not found')
+    return (TEST_SUITES_CACHE_VERSION,) + stamps
+
+
+def _read_test_suites_cache():
+    '''Return the version of the cache and its contents. The version is None
+    if the cache can't be used'''
+    try:
+        version = _test_suites_cache_version()
+    except Exception:
+        return None, {}
+    try:
+        with open(_test_suites_cache_path(), 'rb') as cache_file:
+            cache_version, cache = pickle.load(cache_file)
+        if cache_version == version:
+            return version, cache
+    except Exception:
+        pass
+    return version, {}
+
+
+def _write_test_suites_cache(version: tuple, cache: dict):
+    cache_path = _test_suites_cache_path()
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as cache_file:
+            pickle.dump((version, cache),
+                        cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 class Fluster:
     '''Main class for fluster'''
     # pylint: disable=too-many-instance-attributes
@@ -93,21 +182,65 @@ class Fluster:
         self.resources_dir = resources_dir
         self.results_dir = results_dir
         self.verbose = verbose
-        self.test_suites = []
+        self.test_suites: List[TestSuite] = []
         self.decoders = DECODERS
         self.emoji = EMOJI_RESULT if use_emoji else TEXT_RESULT
+        self._suites_loaded = False
 
-    @lru_cache(maxsize=None)
     def _load_test_suites(self):
-        for root, _, files in os.walk(self.test_suites_dir):
-            for file in files:
-                if os.path.splitext(file)[1] == '.json':
-                    try:
-                        test_suite = TestSuite.from_json_file(
-                            os.path.join(root, file), self.resources_dir)
-                        self.test_suites.append(test_suite)
-                    except Exception as ex:
-                        print(f'Error loading test suite {file}: {ex}')
+        if self._suites_loaded:
+            return
+        self._suites_loaded = True
+        json_files = _find_json_files(self.test_suites_dir)
+        if not json_files:
+            return
+
+        # Reuse the test suites parsed in previous runs whose files didn't change
+        cache_version, cache = None, {}
+        if os.environ.get('FLUSTER_NO_CACHE') != '1':
+            cache_version, cache = _read_test_suites_cache()
+        stamps = {}
+        if cache_version:
+            stamps = {json_file: _file_stamp(json_file)
+                      for json_file in json_files}
+        loaded = {}
+        for json_file in json_files:
+            entry = cache.get(os.path.abspath(json_file))
+            if entry and stamps.get(json_file) and entry[0] == stamps[json_file]:
+                test_suite = entry[1]
+                test_suite.filename = json_file
+                test_suite.resources_dir = self.resources_dir
+                loaded[json_file] = test_suite
+
+        parsed = self._parse_test_suites(
+            [json_file for json_file in json_files if json_file not in loaded])
+        for json_file, test_suite in parsed.items():
+            if stamps.get(json_file):
+                cache[os.path.abspath(json_file)] = (
+                    stamps[json_file], test_suite)
+        loaded.update(parsed)
+        self.test_suites = [loaded[json_file]
+                            for json_file in json_files if json_file in loaded]
+
+        if cache_version and parsed:
+            _write_test_suites_cache(cache_version, {path: entry for path, entry in cache.items()
+                                                     if os.path.exists(path)})
+
+    def _parse_test_suites(self, json_files: list):
+        parsed: Dict[str, TestSuite] = {}
+        if not json_files:
+            return parsed
+        # Parse the test suites concurrently but keep them in discovery order
+        with ThreadPoolExecutor(max_workers=min(len(json_files), 2 * (os.cpu_count() or 1))) as executor:
+            futures = [(json_file, executor.submit(TestSuite.from_json_file, json_file, self.resources_dir))
+                       for json_file in json_files]
+            for json_file, future in futures:
+                try:
+                    parsed[json_file] = future.result()
+                except Exception as ex:
+                    print(
+                        f'Error loading test suite {os.path.basename(json_file)}: {ex}')
+        return parsed
 
     def list_decoders(self, check: bool, verbose: bool):
         '''List all the available decoders'''
@@ -118,37 +251,53 @@ class Fluster:
                 decoders_dict[dec.codec] = []
             decoders_dict[dec.codec].append(dec)
 
+        checks = {}
+        if check and not verbose and self.decoders:
+            # Each check usually spawns a process, so run them all at once.
+            # In verbose mode they run inline to show their output next to
+            # each decoder
+            with ThreadPoolExecutor(max_workers=min(32, len(self.decoders))) as executor:
+                checks = dict(zip(self.decoders, executor.map(
+                    lambda dec: dec.check(verbose), self.decoders)))
+
         for codec in decoders_dict:
             print(f'{codec}'.split('.')[1])
             for decoder in decoders_dict[codec]:
                 string = f'{decoder}'
                 if check:
-                    string += '... ' + (self.emoji[TestVectorResult.Success] if decoder.check(
-                        verbose) else self.emoji[TestVectorResult.Failure])
+                    success = checks[decoder] if decoder in checks else decoder.check(
+                        verbose)
+                    string += '... ' + (self.emoji[TestVectorResult.Success] if success
+                                        else self.emoji[TestVectorResult.Failure])
                 print(string)
 
     def list_test_suites(self, show_test_vectors: bool = False, test_suites: list = None):
         '''List all test suites'''
         self._load_test_suites()
-        print('\nList of available test suites:')
+        # Print everything at once rather than line by line
+        lines = ['\nList of available test suites:']
         if test_suites:
             test_suites = [x.lower() for x in test_suites]
         for test_suite in self.test_suites:
             if test_suites:
-                if test_suite.name.lower() not in test_suites:
+                if test_suite.name_lower not in test_suites:
                     continue
-            print(test_suite)
+            lines.append(str(test_suite))
             if show_test_vectors:
-                for test_vector in test_suite.test_vectors.values():
-                    print(test_vector)
+                lines.extend(str(test_vector)
+                             for test_vector in test_suite.test_vectors.values())
+        print('\n'.join(lines))
 
     def _get_run_param(self, in_list: list, check_list: list, name: str):
         if in_list:
+            # Index the entries by name once instead of scanning them for
+            # every name given, keeping the order in which they were requested
+            entries: Dict[str, list] = {}
+            for entry in check_list:
+                entries.setdefault(entry.name_lower, []).append(entry)
             run = []
             for name_list in in_list:
-                for entry in check_list:
-                    if entry.name.lower() == name_list:
-                        run.append(entry)
+                run.extend(entries.get(name_list, []))
             if not run:
                 raise Exception(
                     f'No {name} found matching {in_list}')
@@ -171,7 +320,6 @@ class Fluster:
 
     def run_test_suites(self, ctx: Context):
         '''Run a group of test suites'''
-        # pylint: disable=too-many-branches
 
         self._load_test_suites()
         self._normalize_context(ctx)
@@ -188,26 +336,31 @@ class Fluster:
         if ctx.reference:
             print('\n=== Reference mode ===\n')
 
+        # Share the same workers among all the test suites and decoders instead
+        # of spawning new ones for each of them
+        if ctx.jobs > 1:
+            with Pool(ctx.jobs) as pool:
+                self._run_test_suites(ctx, pool)
+        else:
+            self._run_test_suites(ctx, None)
+
+    def _run_test_suites(self, ctx: Context, pool: Optional[multiprocessing.pool.Pool]):
+        decoders_by_codec: Dict[Codec, List[Decoder]] = {}
+        for decoder in ctx.decoders:
+            decoders_by_codec.setdefault(decoder.codec, []).append(decoder)
+
         error = False
         no_test_run = True
         for test_suite in ctx.test_suites:
             results = []
-            for decoder in ctx.decoders:
-                if decoder.codec != test_suite.codec:
-                    continue
+            for decoder in decoders_by_codec.get(test_suite.codec, []):
                 test_suite_res = test_suite.run(
-                    ctx.to_test_suite_context(decoder, self.results_dir, ctx.test_vectors))
+                    ctx.to_test_suite_context(decoder, self.results_dir, ctx.test_vectors, pool))
 
                 if test_suite_res:
                     no_test_run = False
                     results.append((decoder, test_suite_res))
-                    success = True
-                    for test_vector in test_suite_res.test_vectors.values():
-                        if test_vector.errors:
-                            success = False
-                            break
-
-                    if not success:
+                    if any(test_vector.errors for test_vector in test_suite_res.test_vectors.values()):
                         error = True
                         if ctx.failfast:
                             sys.exit(1)
@@ -236,34 +389,28 @@ class Fluster:
             self._generate_summary(ctx, results)
 
     def _generate_summary(self, ctx: Context, results: tuple):
-        def _global_stats(results: tuple, test_suites: list, first: bool):
-            separator = f'\n|-|{"-|" * len(results)}'
-            output = separator if not first else ''
-            output += '\n|Test|' if not first else '|Test|'
-            for decoder, _ in results:
-                output += f'{decoder.name}|'
-            output += separator if first else ''
-            output += '\n|TOTAL|'
-            for test_suite in test_suites:
-                output += f'{test_suite.test_vectors_success}/{len(test_suite.test_vectors)}|'
-            output += separator if first else ''
-            return output
-
         test_suite_name = results[0][1].name
         decoder_names = [decoder.name for decoder, _ in results]
         test_suites = [res[1] for res in results]
         print(
             f'Generating summary for test suite {test_suite_name} and decoders {", ".join(decoder_names)}:\n')
 
-        output = ''
-        output += _global_stats(results, test_suites, True)
-        for test_vector in results[0][1].test_vectors.values():
-            output += f'\n|{test_vector.name}|'
-            for test_suite in test_suites:
-                tvector = test_suite.test_vectors[test_vector.name]
-                output += self.emoji[tvector.test_result] + '|'
-        output += _global_stats(results, test_suites, False)
-        output += '\n\n'
+        header = '|Test|' + ''.join(f'{name}|' for name in decoder_names)
+        separator = '|-|' + '-|' * len(results)
+        total = '|TOTAL|' + ''.join(f'{test_suite.test_vectors_success}/{len(test_suite.test_vectors)}|'
+                                    for test_suite in test_suites)
+
+        rows = [header, separator, total, separator]
+        # Every result comes from the same test suite and test vectors filter,
+        # so their test vectors share the same order. Build one column of cells
+        # per decoder and walk them in lockstep instead of looking up each cell
+        columns = [[self.emoji[test_vector.test_result] for test_vector in test_suite.test_vectors.values()]
+                   for test_suite in test_suites]
+        for test_vector_name, *cells in zip(results[0][1].test_vectors, *columns):
+            rows.append(f'|{test_vector_name}|' +
+                        ''.join(f'{cell}|' for cell in cells))
+        rows += [separator, header, total]
+        output = '\n'.join(rows) + '\n\n'
         if ctx.summary_output:
             with open(ctx.summary_output, 'w+', encoding="utf-8") as summary_file:
                 summary_file.write(output)
@@ -278,6 +425,7 @@ class Fluster:
         else:
             test_suites = [
                 t for t in self.test_suites if t.name in test_suites]
-        for test_suite in test_suites:
-            test_suite.download(jobs, self.resources_dir,
-                                verify=True, keep_file=keep_file)
+        # Download all the test suites at once so that the jobs are shared
+        # among them instead of waiting for each test suite to finish
+        TestSuite.download_test_suites(test_suites, jobs, self.resources_dir,
+                                       verify=True, keep_file=keep_file)
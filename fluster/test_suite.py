@@ -22,8 +22,10 @@ import json
 import unittest
 import copy
 from multiprocessing import Pool
+import multiprocessing.pool
 from unittest.result import TestResult
 from time import perf_counter
+from typing import Optional
 from shutil import rmtree
 
 from fluster.test_vector import TestVector
@@ -32,6 +34,12 @@ from fluster.decoder import Decoder
 from fluster.test import Test
 from fluster import utils
 
+# orjson is optional and only used to speed up loading the test suites
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class DownloadWork:
     '''Context to pass to each download worker'''
@@ -51,7 +59,8 @@ class Context:
     # pylint: disable=too-many-instance-attributes
 
     def __init__(self, jobs: int, decoder: Decoder, timeout: int, failfast: bool, quiet: bool, results_dir: str,
-                 reference: bool = False, test_vectors: list = None, keep_files: bool = False, verbose: bool = False):
+                 reference: bool = False, test_vectors: list = None, keep_files: bool = False, verbose: bool = False,
+                 pool: Optional[multiprocessing.pool.Pool] = None):
         self.jobs = jobs
         self.decoder = decoder
         self.timeout = timeout
@@ -62,6 +71,7 @@ class Context:
         self.test_vectors = test_vectors
         self.keep_files = keep_files
         self.verbose = verbose
+        self.pool = pool
 
 
 class TestSuite:
@@ -82,6 +92,11 @@ class TestSuite:
         self.test_vectors_success = 0
         self.time_taken = 0
 
+    @property
+    def name_lower(self):
+        '''Return the name of the test suite in lowercase'''
+        return self.name.lower()
+
     def clone(self):
         '''Create a deep copy of the object'''
         return copy.deepcopy(self)
@@ -89,8 +104,9 @@ class TestSuite:
     @classmethod
     def from_json_file(cls, filename: str, resources_dir: str):
         '''Create a TestSuite instance from a file'''
-        with open(filename) as json_file:
-            data = json.load(json_file)
+        with open(filename, 'rb') as json_file:
+            data = orjson.loads(
+                json_file.read()) if orjson else json.load(json_file)
             data['test_vectors'] = dict(
                 map(TestVector.from_json, data["test_vectors"]))
             data['codec'] = Codec(data['codec'])
@@ -109,7 +125,8 @@ class TestSuite:
                                     for tv in self.test_vectors.values()]
             json.dump(data, json_file, indent=4)
 
-    def _download_worker(self, context: DownloadWork):
+    @staticmethod
+    def _download_worker(context: DownloadWork):
         '''Download and extract a test vector'''
         test_vector = context.test_vector
         dest_dir = os.path.join(
@@ -135,20 +152,29 @@ class TestSuite:
 
     def download(self, jobs: int, out_dir: str, verify: bool, extract_all: bool = False, keep_file: bool = False):
         '''Download the test suite'''
+        self.download_test_suites(
+            [self], jobs, out_dir, verify, extract_all, keep_file)
+
+    @classmethod
+    def download_test_suites(cls, test_suites: list, jobs: int, out_dir: str, verify: bool, extract_all: bool = False,
+                             keep_file: bool = False):
+        '''Download a group of test suites sharing the same parallel jobs'''
         if not os.path.exists(out_dir):
             os.makedirs(out_dir)
-        print(f'Downloading test suite {self.name} using {jobs} parallel jobs')
         download_tasks = []
-        for test_vector in self.test_vectors.values():
-            download_tasks.append(
-                DownloadWork(out_dir, verify, extract_all, keep_file, self.name, test_vector))
+        for test_suite in test_suites:
+            print(
+                f'Downloading test suite {test_suite.name} using {jobs} parallel jobs')
+            for test_vector in test_suite.test_vectors.values():
+                download_tasks.append(
+                    DownloadWork(out_dir, verify, extract_all, keep_file, test_suite.name, test_vector))
 
         with Pool(jobs) as pool:
-            pool.map(self._download_worker, download_tasks, chunksize=1)
+            pool.map(cls._download_worker, download_tasks, chunksize=1)
 
         print('All downloads finished')
 
-    def _rename_test(self, test: Test, module, qualname):
+    def _rename_test(self, test: Test, module: str, qualname: str):
         test_cls = type(test)
         test_cls.__module__ = module
         test_cls.__qualname__ = qualname
@@ -215,29 +241,33 @@ class TestSuite:
 
         self._rename_test(test, module_orig, qualname_orig)
 
-    def run_test_suite_in_parallel(self, jobs: int, tests: list):
-        '''Run the test suite in parallel'''
-        with Pool(jobs) as pool:
-            start = perf_counter()
-            test_results = pool.map(self._run_worker, tests)
-            self.time_taken = perf_counter() - start
-            print('\n')
-            self.test_vectors_success = 0
-            for test_vector_res in test_results:
-                if test_vector_res.errors:
-                    for error in test_vector_res.errors:
-                        # Use same format to report errors as TextTestRunner
-                        print(f'{"=" * 71}\nFAIL: {error[0]}\n{"-" * 70}')
-                        for line in error[1:]:
-                            print(line)
-                else:
-                    self.test_vectors_success += 1
-
-                # Collect the test vector results and failures since they come
-                # from a different process
-                self.test_vectors[test_vector_res.name] = test_vector_res
-            print(
-                f'Ran {self.test_vectors_success}/{len(test_results)} tests successfully in {self.time_taken:.3f} secs')
+    def run_test_suite_in_parallel(self, jobs: int, tests: list, pool: Optional[multiprocessing.pool.Pool] = None):
+        '''Run the test suite in parallel, reusing the pool of workers if given'''
+        if pool is None:
+            with Pool(jobs) as new_pool:
+                self.run_test_suite_in_parallel(jobs, tests, new_pool)
+            return
+
+        start = perf_counter()
+        test_results = pool.map(self._run_worker, tests)
+        self.time_taken = perf_counter() - start
+        print('\n')
+        self.test_vectors_success = 0
+        for test_vector_res in test_results:
+            if test_vector_res.errors:
+                for error in test_vector_res.errors:
+                    # Use same format to report errors as TextTestRunner
+                    print(f'{"=" * 71}\nFAIL: {error[0]}\n{"-" * 70}')
+                    for line in error[1:]:
+                        print(line)
+            else:
+                self.test_vectors_success += 1
+
+            # Collect the test vector results and failures since they come
+            # from a different process
+            self.test_vectors[test_vector_res.name] = test_vector_res
+        print(
+            f'Ran {self.test_vectors_success}/{len(test_results)} tests successfully in {self.time_taken:.3f} secs')
 
     def run(self, ctx: Context):
         '''
@@ -274,7 +304,7 @@ class TestSuite:
             test_suite.run_test_suite_sequentially(
                 tests, ctx.failfast, ctx.quiet)
         else:
-            test_suite.run_test_suite_in_parallel(ctx.jobs, tests)
+            test_suite.run_test_suite_in_parallel(ctx.jobs, tests, ctx.pool)
 
         if ctx.reference:
             test_suite.to_json_file(test_suite.filename)
@@ -288,9 +318,11 @@ class TestSuite:
         '''Generate the tests for a decoder'''
         tests = []
         test_vectors_run = dict()
+        test_vectors_filter = set(
+            ctx.test_vectors) if ctx.test_vectors else None
         for name, test_vector in self.test_vectors.items():
-            if ctx.test_vectors:
-                if test_vector.name.lower() not in ctx.test_vectors:
+            if test_vectors_filter:
+                if test_vector.name.lower() not in test_vectors_filter:
                     continue
             tests.append(
                 Test(ctx.decoder, self, test_vector, ctx.results_dir, ctx.reference, ctx.timeout, ctx.keep_files,
@@ -18,6 +18,7 @@
 # Free Software Foundation, Inc., 59 Temple Place - Suite 330,
 # Boston, MA 02111-1307, USA.
 
+from functools import lru_cache
 import hashlib
 import os
 import shutil
@@ -28,6 +29,7 @@ import platform
 
 
 TARBALL_EXTS = ('tar.gz', 'tgz', 'tar.bz2', 'tbz2', 'tar.xz')
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def download(url: str, dest_dir: str):
@@ -35,13 +37,20 @@ def download(url: str, dest_dir: str):
     with urllib.request.urlopen(url) as response:
         dest_path = os.path.join(dest_dir, url.split('/')[-1])
         with open(dest_path, 'wb') as dest:
-            shutil.copyfileobj(response, dest)
+            shutil.copyfileobj(response, dest, DOWNLOAD_CHUNK_SIZE)
 
 
 def file_checksum(path: str):
-    '''Calculates the checksum of a file reading chunks of 64KiB'''
-    md5 = hashlib.md5()
+    '''Calculates the MD5 checksum of a file'''
     with open(path, 'rb') as file:
+        # Files are read once from start to end, so let the kernel read ahead
+        # aggressively when the file is not in the page cache yet
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # hashlib.file_digest (Python 3.11+) reads into a reusable buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(file, 'md5').hexdigest()
+        md5 = hashlib.md5()
         while True:
             data = file.read(65536)
             if not data:
@@ -89,6 +98,33 @@ def normalize_binary_cmd(cmd: str):
     return cmd
 
 
+@lru_cache(maxsize=None)
+def _path_entries():
+    '''Return the names of all the files found in the PATH directories'''
+    entries = set()
+    for directory in os.get_exec_path():
+        try:
+            entries.update(os.path.normcase(entry)
+                           for entry in os.listdir(directory))
+        except OSError:
+            continue
+    return frozenset(entries)
+
+
+def find_binary(binary: str, verbose: bool = False):
+    '''Return the path of a binary or None if it can't be found in the PATH'''
+    path = None
+    # Listing the PATH once lets us discard the missing binaries without
+    # looking for them in every directory. On Windows shutil.which also looks
+    # in the current directory, so leave the whole lookup to it there
+    if platform.system() == 'Windows' or os.path.dirname(binary) or \
+            os.path.normcase(binary) in _path_entries():
+        path = shutil.which(binary)
+    if verbose and not path:
+        print(f"Binary {binary} can't be found to be executed")
+    return path
+
+
 def normalize_path(path: str):
     '''Normalize the path to make it Unix-like'''
     if platform.system() == 'Windows':
@@ -101,18 +101,16 @@ class JCTVTGenerator:
             test_suite.download(jobs=jobs, out_dir=test_suite.resources_dir, verify=False,
                                 extract_all=True, keep_file=True)
 
+        self._checksum_sources(test_suite, jobs)
         for test_vector in test_suite.test_vectors.values():
             dest_dir = os.path.join(
                 test_suite.resources_dir, test_suite.name, test_vector.name)
-            dest_path = os.path.join(
-                dest_dir, os.path.basename(test_vector.source))
             test_vector.input_file = self._find_by_ext(
                 dest_dir, BITSTREAM_EXTS)
             test_vector.input_file = test_vector.input_file.replace(os.path.join(
                 test_suite.resources_dir, test_suite.name, test_vector.name) + os.sep, '')
             if not test_vector.input_file:
                 raise Exception(f'Bitstream file not found in {dest_dir}')
-            test_vector.source_checksum = utils.file_checksum(dest_path)
             if 'main10' in test_vector.name.lower():
                 test_vector.output_format = PixelFormat.yuv420p10le
 
@@ -124,6 +122,17 @@ class JCTVTGenerator:
         test_suite.to_json_file(output_filepath)
         print('Generate new test suite: ' + test_suite.name + '.json')
 
+    def _checksum_sources(self, test_suite: TestSuite, jobs: int):
+        '''Calculate the checksums of all the downloaded sources in parallel and
+        store them in the test vectors'''
+        dest_paths = [os.path.join(test_suite.resources_dir, test_suite.name, test_vector.name,
+                                   os.path.basename(test_vector.source))
+                      for test_vector in test_suite.test_vectors.values()]
+        with multiprocessing.Pool(jobs) as pool:
+            checksums = pool.map(utils.file_checksum, dest_paths, chunksize=8)
+        for test_vector, checksum in zip(test_suite.test_vectors.values(), checksums):
+            test_vector.source_checksum = checksum
+
     def _fill_checksum_h264(self, test_vector, dest_dir):
         raw_file = self._find_by_ext(dest_dir, RAW_EXTS)
         if raw_file is None: